@@ -0,0 +1,41 @@
+# One-off pass that writes the resized variants for uploads saved before the
+# variant pipeline existed. Safe to run more than once; variants are rewritten.
+# Variants whose original is gone, including those named by stem only
+# (cert.thumb.webp, before variant names kept the extension), are removed.
+import os
+from app import app, UPLOAD_VARIANTS, make_upload_variants
+
+
+def variant_source(filename, variant_markers):
+    """The upload a variant file was made from, or None if filename is not a variant."""
+    for marker in variant_markers:
+        if marker in filename:
+            return filename[:filename.index(marker)]
+    return None
+
+
+def backfill_upload_variants():
+    folder = app.config['UPLOAD_FOLDER']
+    variant_markers = tuple(f".{variant}." for variant in UPLOAD_VARIANTS)
+    filenames = sorted(os.listdir(folder))
+    original_total = saved_total = removed = 0
+    for filename in filenames:
+        if filename.endswith('.tmp'):
+            continue
+        source = variant_source(filename, variant_markers)
+        if source is not None:
+            if source not in filenames:
+                os.remove(os.path.join(folder, filename))
+                removed += 1
+            continue
+        sizes = make_upload_variants(filename)
+        if sizes:
+            original = os.path.getsize(os.path.join(folder, filename))
+            original_total += original
+            saved_total += original - sizes['card']
+
+    print(f"Removed {removed} variants without an original.")
+    print(f"\nOriginals: {original_total} bytes; serving card variants instead saves {saved_total} bytes. ✅")
+
+if __name__ == '__main__':
+    backfill_upload_variants()
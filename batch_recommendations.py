@@ -0,0 +1,150 @@
+# Precomputes every student's recommended jobs into student_recommendation so
+# logins during placement season read a stored list instead of scoring live.
+# Uses the same TF-IDF index and score formula as get_recommendations: each
+# chunk of students is vectorised and multiplied against the whole job matrix
+# in one sparse product, and chunks are spread over a process pool.
+# Students whose profile changes after a run fall back to live scoring.
+#
+#   python batch_recommendations.py [--workers 4] [--chunk-size 1000] [--top-k 20]
+import argparse
+import json
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import numpy as np
+from sqlalchemy import delete, insert
+from sqlalchemy.orm import load_only
+
+from app import (app, db, JobIndex, Student, StudentProject, JobApplication, StudentRecommendation,
+                 StudentRecommendationRun,
+                 build_student_doc, build_roadmap, combine_recommendation_scores, parse_skills, top_k_jobs,
+                 RECOMMENDATION_BATCH_K, RECOMMENDATION_MIN_SCORE)
+
+CHUNK_SIZE = 1000
+
+# per-process copy of the job index, set once by init_worker
+worker_state = {}
+
+
+def init_worker(vectorizer, job_matrix, cgpa_required):
+    # vectorizer and job_matrix are None when the postings share no terms at all
+    worker_state['vectorizer'] = vectorizer
+    worker_state['job_terms'] = job_matrix.T.tocsr() if job_matrix is not None else None
+    worker_state['cgpa_required'] = cgpa_required
+
+
+def score_chunk(students, top_k):
+    """Top-k job positions and scores for each (doc, cgpa, project_count, applied_positions)."""
+    docs = [doc for doc, _, _, _ in students]
+    if worker_state['vectorizer'] is None:
+        content = np.zeros((len(docs), len(worker_state['cgpa_required'])))
+    else:
+        content = (worker_state['vectorizer'].transform(docs) @ worker_state['job_terms']).toarray()
+
+    results = []
+    for content_scores, (_, cgpa, project_count, applied) in zip(content, students):
+        scores = combine_recommendation_scores(content_scores, cgpa, project_count, worker_state['cgpa_required'])
+        eligible = scores > RECOMMENDATION_MIN_SCORE
+        eligible[applied] = False
+        top = top_k_jobs(scores, np.flatnonzero(eligible), top_k)
+        results.append((top, scores[top]))
+    return results
+
+
+def student_chunks(chunk_size, job_positions):
+    """Yields (student ids, skill sets, worker payload) for consecutive id ranges."""
+    last_id = 0
+    while True:
+        students = Student.query.options(load_only(Student.id, Student.skills, Student.cgpa))\
+            .filter(Student.id > last_id).order_by(Student.id).limit(chunk_size).all()
+        if not students:
+            return
+        ids = [s.id for s in students]
+
+        projects = defaultdict(list)
+        for project in StudentProject.query.filter(StudentProject.student_id.in_(ids)):
+            projects[project.student_id].append(project)
+        applied = defaultdict(list)
+        for student_id, job_id in db.session.query(JobApplication.student_id, JobApplication.job_id)\
+                .filter(JobApplication.student_id.in_(ids)):
+            if job_id in job_positions:
+                applied[student_id].append(job_positions[job_id])
+
+        skill_sets, payload = [], []
+        for s in students:
+            skills_list = parse_skills(s.skills)
+            skill_sets.append({skill.lower().strip() for skill in skills_list})
+            payload.append((build_student_doc(skills_list, projects[s.id]), s.cgpa,
+                            len(projects[s.id]), applied[s.id]))
+        yield ids, skill_sets, payload
+        last_id = ids[-1]
+        db.session.expunge_all()
+
+
+def batch_recommendations(workers, chunk_size, top_k):
+    with app.app_context():
+        db.create_all()
+        # profiles edited from here on are newer than this batch and get scored live
+        computed_at = datetime.utcnow()
+        start = time.perf_counter()
+
+        index = JobIndex()
+        index.rebuild()
+        if not len(index.job_ids):
+            # lists from an earlier run point at jobs that are gone; without rows
+            # get_recommendations scores live, which finds nothing either
+            removed = db.session.execute(delete(StudentRecommendation)).rowcount
+            db.session.execute(delete(StudentRecommendationRun))
+            db.session.commit()
+            print(f"No job postings to recommend; removed {removed} stored recommendations.")
+            return
+        job_ids = index.job_ids
+        job_positions = {int(job_id): pos for pos, job_id in enumerate(job_ids)}
+        print(f"Indexed {len(job_ids)} jobs in {time.perf_counter() - start:.1f}s")
+
+        chunks = {}
+        students_done = rows_written = 0
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                                 initargs=(index.vectorizer, index.matrix, index.cgpa_required)) as pool:
+            futures = []
+            for n, (ids, skill_sets, payload) in enumerate(student_chunks(chunk_size, job_positions)):
+                chunks[n] = (ids, skill_sets)
+                futures.append(pool.submit(score_chunk, payload, top_k))
+
+            for n, future in enumerate(futures):
+                ids, skill_sets = chunks.pop(n)
+                rows, runs = [], []
+                for student_id, skills, (top, scores) in zip(ids, skill_sets, future.result()):
+                    # written even for an empty top-k, so the student is not scored live instead
+                    runs.append({'student_id': student_id, 'computed_at': computed_at, 'row_count': len(top)})
+                    for rank, (pos, score) in enumerate(zip(top, scores), start=1):
+                        rows.append({
+                            'student_id': student_id, 'rank': rank, 'job_id': int(job_ids[pos]),
+                            'score': float(score), 'computed_at': computed_at,
+                            'roadmap': json.dumps(build_roadmap(index.skills[pos], skills)),
+                        })
+                db.session.execute(delete(StudentRecommendation).where(StudentRecommendation.student_id.in_(ids)))
+                db.session.execute(delete(StudentRecommendationRun).where(StudentRecommendationRun.student_id.in_(ids)))
+                if rows:
+                    db.session.execute(insert(StudentRecommendation), rows)
+                db.session.execute(insert(StudentRecommendationRun), runs)
+                db.session.commit()
+
+                students_done += len(ids)
+                rows_written += len(rows)
+                elapsed = time.perf_counter() - start
+                print(f"  {students_done} students scored ({students_done / elapsed:.0f} students/s)")
+
+        elapsed = time.perf_counter() - start
+        print(f"\nStored {rows_written} recommendations for {students_done} students in {elapsed:.1f}s. ✅")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Precompute top-k job recommendations for every student.")
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+    parser.add_argument('--top-k', type=int, default=RECOMMENDATION_BATCH_K)
+    args = parser.parse_args()
+    batch_recommendations(args.workers, args.chunk_size, args.top_k)
@@ -0,0 +1,48 @@
+"""
+Time-to-first-byte of /chatbot_api (blocking) vs /chatbot_stream (SSE),
+measured offline against the fake chat backend.
+
+  python bench_chatbot.py [--runs 5] [--first-token-delay 0.3] [--token-delay 0.02]
+"""
+import argparse
+import os
+import time
+
+os.environ['CHATBOT_BACKEND'] = 'fake'
+
+import app as chatbot_app
+from app import app, FakeChatModel
+
+
+def measure(client, url, runs):
+    first_byte, total = [], []
+    for _ in range(runs):
+        chatbot_app.CHAT_REPLY_CACHE.replies.clear()  # measure the upstream path, not cache hits
+        start = time.perf_counter()
+        response = client.post(url, json={'message': 'How do I prepare for placements?'}, buffered=False)
+        chunks = iter(response.response)
+        next(chunks)
+        first_byte.append(time.perf_counter() - start)
+        for _ in chunks:
+            pass
+        total.append(time.perf_counter() - start)
+        response.close()
+    return sum(first_byte) / runs * 1000, sum(total) / runs * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--first-token-delay', type=float, default=0.3)
+    parser.add_argument('--token-delay', type=float, default=0.02)
+    args = parser.parse_args()
+
+    chatbot_app.FAKE_CHAT_MODEL = FakeChatModel(token_delay=args.token_delay,
+                                                first_token_delay=args.first_token_delay)
+    client = app.test_client()
+    for url in ('/chatbot_api', '/chatbot_stream'):
+        ttfb, total = measure(client, url, args.runs)
+        print(f"{url}: first byte {ttfb:.0f} ms, full reply {total:.0f} ms")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+"""
+Shows how the model indexes change the plans and timings of the hot queries.
+
+  python bench_query_plans.py [--students 20000] [--jobs 5000]
+
+Seeds a throwaway SQLite database (never DATABASE_URL), then runs every query
+with the indexes in place and again after dropping them.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+DB_PATH = os.path.join(tempfile.gettempdir(), 'bench_query_plans.db')
+os.environ['DATABASE_URL'] = f'sqlite:///{DB_PATH}'
+
+from sqlalchemy import func, insert, select, text
+from app import (app, db, BPUT_COLLEGES, INDIAN_IT_CITIES, Company, JobApplication,
+                 JobPosting, Message, Student)
+
+STATUSES = ['Applied', 'Applied', 'Rejected', 'Accepted']
+REPEATS = 20
+
+
+def seed(num_students, num_jobs, apps_per_student, messages_per_app):
+    rnd = random.Random(42)
+    now = datetime.utcnow()
+    db.drop_all()
+    db.create_all()
+
+    num_companies = max(num_jobs // 20, 1)
+    db.session.execute(insert(Company), [
+        {'company_name': f'Company {i}', 'email': f'c{i}@bench.in', 'password_hash': 'x'}
+        for i in range(1, num_companies + 1)
+    ])
+    db.session.execute(insert(JobPosting), [
+        {'company_id': rnd.randint(1, num_companies), 'job_role': 'Engineer', 'required_skills': '[]',
+         'cgpa_required': 6.0, 'location': rnd.choice(INDIAN_IT_CITIES),
+         'created_at': now - timedelta(minutes=i)}
+        for i in range(1, num_jobs + 1)
+    ])
+    db.session.execute(insert(Student), [
+        {'full_name': f'Student {rnd.randint(0, 10 ** 6):07d}', 'email': f's{i}@bench.in',
+         'college': rnd.choice(BPUT_COLLEGES), 'registration_number': f'{i:010d}',
+         'password_hash': 'x', 'skills': '[]'}
+        for i in range(1, num_students + 1)
+    ])
+    applications = []
+    for student_id in range(1, num_students + 1):
+        for job_id in rnd.sample(range(1, num_jobs + 1), apps_per_student):
+            applications.append({'student_id': student_id, 'job_id': job_id,
+                                  'status': rnd.choice(STATUSES),
+                                  'applied_at': now - timedelta(seconds=rnd.randint(0, 10 ** 6))})
+    db.session.execute(insert(JobApplication), applications)
+    db.session.execute(insert(Message), [
+        {'application_id': app_id, 'sender_id': 1, 'sender_role': 'student', 'content': 'hello',
+         'timestamp': now + timedelta(seconds=k)}
+        for app_id in range(1, len(applications) + 1, 5)
+        for k in range(messages_per_app)
+    ])
+    db.session.commit()
+    return len(applications)
+
+
+def hot_queries():
+    return {
+        'my_applications': select(JobApplication).where(JobApplication.student_id == 1234)
+            .order_by(JobApplication.applied_at.desc()),
+        'applicants': select(JobApplication).where(JobApplication.job_id == 321)
+            .order_by(JobApplication.applied_at),
+        'apply_job duplicate check': select(JobApplication.id)
+            .where(JobApplication.student_id == 1234, JobApplication.job_id == 321),
+        'placed students': select(JobApplication.student_id).where(JobApplication.status == 'Accepted')
+            .distinct(),
+        'jobs in city': select(JobPosting).where(JobPosting.location == 'Pune')
+            .order_by(JobPosting.created_at.desc()),
+        'company jobs': select(JobPosting).where(JobPosting.company_id == 7)
+            .order_by(JobPosting.created_at.desc()),
+        'college students': select(Student.id, Student.full_name).where(Student.college == BPUT_COLLEGES[2])
+            .order_by(Student.full_name),
+        'conversation': select(Message).where(Message.application_id == 501)
+            .order_by(Message.timestamp),
+        'student accepted apps': select(func.count()).select_from(JobApplication)
+            .where(JobApplication.student_id == 1234, JobApplication.status == 'Accepted'),
+    }
+
+
+def run(queries):
+    results = {}
+    with db.engine.connect() as conn:
+        for name, query in queries.items():
+            sql = str(query.compile(db.engine, compile_kwargs={'literal_binds': True}))
+            plan = ' | '.join(row[-1] for row in conn.execute(text(f'EXPLAIN QUERY PLAN {sql}')))
+            start = time.perf_counter()
+            for _ in range(REPEATS):
+                conn.execute(text(sql)).fetchall()
+            results[name] = (plan, (time.perf_counter() - start) / REPEATS * 1000)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--students', type=int, default=20000)
+    parser.add_argument('--jobs', type=int, default=5000)
+    parser.add_argument('--apps-per-student', type=int, default=5)
+    parser.add_argument('--messages-per-app', type=int, default=4)
+    args = parser.parse_args()
+
+    with app.app_context():
+        print(f"Seeding {DB_PATH} ...")
+        num_apps = seed(args.students, args.jobs, args.apps_per_student, args.messages_per_app)
+        print(f"{args.students} students, {args.jobs} jobs, {num_apps} applications\n")
+
+        indexed = run(hot_queries())
+        with db.engine.begin() as conn:
+            for table in db.metadata.sorted_tables:
+                for index in table.indexes:
+                    conn.execute(text(f'DROP INDEX {index.name}'))
+        # sqlite3 caches prepared statements per connection, plans included
+        db.engine.dispose()
+        unindexed = run(hot_queries())
+
+    for name in indexed:
+        plan_after, ms_after = indexed[name]
+        plan_before, ms_before = unindexed[name]
+        print(f"{name}: {ms_before:.2f} ms -> {ms_after:.2f} ms")
+        print(f"    without indexes: {plan_before}")
+        print(f"    with indexes:    {plan_after}")
+
+    os.remove(DB_PATH)
+
+if __name__ == '__main__':
+    main()
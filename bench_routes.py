@@ -0,0 +1,289 @@
+# End-to-end latency of the heavy pages against a generated dataset.
+# Builds (or reuses) a throwaway database with tens of thousands of students,
+# jobs, applications and messages, drives each route through the Flask test
+# client and reports p50/p95 latency, SQL queries per request and throughput.
+# Results are written as JSON; pass --compare to diff against an earlier run.
+#
+#   python bench_routes.py [--students 20000] [--jobs 5000] [--requests 30]
+#   python bench_routes.py --reuse --output after.json --compare before.json
+#
+# Never point --database-url at a real database: it is dropped and recreated.
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+DEFAULT_DATABASE_URL = 'sqlite:////tmp/elevatr_bench.db'
+SEED = 42
+BATCH_SIZE = 5000
+
+ROUTES = ('student_profile', 'all_internship_opportunity', 'all_internship_opportunity_city',
+          'applicants', 'college_dashboard', 'university_dashboard', 'conversation')
+
+FIRST_NAMES = ['Aarav', 'Ananya', 'Rohan', 'Priya', 'Vikram', 'Sneha', 'Arjun', 'Isha', 'Kabir', 'Diya',
+               'Aditya', 'Meera', 'Sai', 'Pooja', 'Rahul', 'Nisha', 'Karan', 'Riya', 'Amit', 'Tanvi']
+LAST_NAMES = ['Mohanty', 'Das', 'Patnaik', 'Sahoo', 'Mishra', 'Nayak', 'Panda', 'Behera', 'Rath', 'Swain']
+PROJECT_TITLES = ['Portfolio website', 'Chat application', 'Expense tracker', 'Image classifier',
+                  'Inventory API', 'Weather dashboard', 'Quiz app', 'Sentiment analyser']
+MESSAGES = ['Hi, thanks for applying!', 'Can you share your availability?', 'Sure, tomorrow works.',
+            'Please find my resume attached.', 'We would like to schedule an interview.', 'Thank you!']
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the main routes against a synthetic dataset.")
+    parser.add_argument('--database-url', default=os.getenv('BENCH_DATABASE_URL', DEFAULT_DATABASE_URL))
+    parser.add_argument('--reuse', action='store_true', help="skip generation and use the existing database")
+    parser.add_argument('--students', type=int, default=20000)
+    parser.add_argument('--companies', type=int, default=500)
+    parser.add_argument('--jobs', type=int, default=5000)
+    parser.add_argument('--applications', type=int, default=60000)
+    parser.add_argument('--messages', type=int, default=50000)
+    parser.add_argument('--requests', type=int, default=30, help="timed requests per route")
+    parser.add_argument('--output', default='bench_results.json')
+    parser.add_argument('--compare', help="earlier results file to diff against")
+    return parser.parse_args()
+
+
+ARGS = parse_args()
+# app.py reads DATABASE_URL at import time
+os.environ['DATABASE_URL'] = ARGS.database_url
+os.environ.setdefault('CHATBOT_BACKEND', 'fake')
+
+from sqlalchemy import event, func, insert, select
+from werkzeug.security import generate_password_hash
+
+from app import (app, db, Student, StudentProject, Company, JobPosting, JobApplication, Message,
+                 Skill, student_skill, job_skill, canonical_skill, BPUT_COLLEGES, INDIAN_IT_CITIES)
+
+
+def insert_batches(table, rows):
+    for start in range(0, len(rows), BATCH_SIZE):
+        db.session.execute(insert(table), rows[start:start + BATCH_SIZE])
+
+
+def skill_vocabulary():
+    import pandas as pd
+    catalog = pd.read_csv(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'internship_posted_data.csv'))
+    roles = catalog['role'].dropna().unique().tolist()
+    skills = sorted({s.strip() for raw in catalog['skills'].dropna() for s in raw.split(',') if s.strip()})
+    return roles, skills
+
+
+def generate_dataset(args):
+    rng = np.random.default_rng(SEED)
+    random.seed(SEED)
+    roles, skills = skill_vocabulary()
+    password_hash = generate_password_hash('pass1234')
+    now = datetime.utcnow()
+    start = time.perf_counter()
+
+    db.drop_all()
+    db.create_all()
+
+    insert_batches(Skill, [{'id': canonical_skill(s), 'name': s[:100]} for s in
+                           {canonical_skill(s): s for s in skills}.values()])
+
+    insert_batches(Company, [{'id': i, 'company_name': f"Bench Company {i}", 'email': f"company{i}@bench.in",
+                              'password_hash': password_hash} for i in range(1, args.companies + 1)])
+
+    jobs, links = [], []
+    for i in range(1, args.jobs + 1):
+        job_skills = random.sample(skills, k=int(rng.integers(3, 9)))
+        role = random.choice(roles)
+        jobs.append({
+            'id': i, 'company_id': int(rng.integers(1, args.companies + 1)), 'job_role': role,
+            'description': f"Seeking a talented {role} to join our team. Key skills include {', '.join(job_skills)}.",
+            'required_skills': json.dumps(job_skills), 'cgpa_required': float(rng.choice([6.0, 6.5, 7.0, 7.5, 8.0])),
+            'location': random.choice(INDIAN_IT_CITIES), 'created_at': now - timedelta(minutes=args.jobs - i),
+            'updated_at': now - timedelta(minutes=args.jobs - i),
+        })
+        links.extend({'job_id': i, 'skill_id': canonical_skill(s)} for s in {canonical_skill(s): s for s in job_skills})
+    insert_batches(JobPosting, jobs)
+    insert_batches(job_skill, links)
+
+    students, links, projects = [], [], []
+    for i in range(1, args.students + 1):
+        student_skills = random.sample(skills, k=int(rng.integers(2, 10)))
+        students.append({
+            'id': i, 'full_name': f"{random.choice(FIRST_NAMES)} {random.choice(LAST_NAMES)} {i}",
+            'email': f"student{i}@bench.in", 'college': BPUT_COLLEGES[i % len(BPUT_COLLEGES)],
+            'registration_number': f"B{i:09d}", 'password_hash': password_hash,
+            'cgpa': round(float(rng.uniform(5.5, 9.8)), 2), 'skills': json.dumps(student_skills),
+        })
+        links.extend({'student_id': i, 'skill_id': canonical_skill(s)} for s in {canonical_skill(s): s for s in student_skills})
+        for _ in range(int(rng.integers(0, 3))):
+            projects.append({'student_id': i, 'project_title': random.choice(PROJECT_TITLES),
+                             'description': f"Built with {', '.join(random.sample(student_skills, k=min(2, len(student_skills))))}."})
+    insert_batches(Student, students)
+    insert_batches(student_skill, links)
+    insert_batches(StudentProject, projects)
+
+    pairs = set()
+    while len(pairs) < min(args.applications, args.students * args.jobs):
+        pairs.add((int(rng.integers(1, args.students + 1)), int(rng.integers(1, args.jobs + 1))))
+    statuses = rng.choice(['Applied', 'Accepted', 'Rejected'], size=len(pairs), p=[0.7, 0.1, 0.2])
+    insert_batches(JobApplication, [
+        {'id': i, 'student_id': sid, 'job_id': jid, 'status': str(status), 'applied_at': now}
+        for i, ((sid, jid), status) in enumerate(zip(sorted(pairs), statuses), start=1)
+    ])
+
+    threads = rng.integers(1, len(pairs) + 1, size=args.messages)
+    insert_batches(Message, [
+        {'application_id': int(aid), 'sender_id': 1, 'sender_role': random.choice(['student', 'company']),
+         'content': random.choice(MESSAGES), 'timestamp': now - timedelta(seconds=args.messages - n)}
+        for n, aid in enumerate(threads)
+    ])
+    db.session.commit()
+    print(f"Generated dataset in {time.perf_counter() - start:.1f}s")
+
+
+def dataset_sizes():
+    return {model.__tablename__: db.session.scalar(select(func.count()).select_from(model))
+            for model in (Student, Company, JobPosting, JobApplication, Message, StudentProject)}
+
+
+def session_client(role, user_id, **extra):
+    client = app.test_client()
+    with client.session_transaction() as s:
+        s['logged_in'] = True
+        s['role'] = role
+        s['user_id'] = user_id
+        s.update(extra)
+    return client
+
+
+def request_factories():
+    """Route name -> callable returning (client, url) for one randomly chosen request."""
+    student_ids = db.session.scalars(select(Student.id)).all()
+    job_owners = db.session.execute(select(JobPosting.id, JobPosting.company_id)
+                                    .where(JobPosting.applications.any())).all()
+    threads = db.session.execute(select(JobApplication.id, JobApplication.student_id)
+                                 .where(JobApplication.messages.any())).all()
+
+    def student_page(url):
+        def build():
+            return session_client('student', random.choice(student_ids)), url
+        return build
+
+    def city_page():
+        return session_client('student', random.choice(student_ids)), \
+            f"/all_internship_opportunity?location={random.choice(INDIAN_IT_CITIES)}"
+
+    def applicants():
+        job_id, company_id = random.choice(job_owners)
+        return session_client('company', company_id), f"/applicants/{job_id}"
+
+    def college_dashboard():
+        return session_client('college', 1, college_name=random.choice(BPUT_COLLEGES)), '/college_dashboard'
+
+    def university_dashboard():
+        return session_client('university', 1), '/university_dashboard'
+
+    def conversation():
+        application_id, student_id = random.choice(threads)
+        return session_client('student', student_id), f"/conversation/{application_id}"
+
+    return {
+        'student_profile': student_page('/student_profile'),
+        'all_internship_opportunity': student_page('/all_internship_opportunity'),
+        'all_internship_opportunity_city': city_page,
+        'applicants': applicants,
+        'college_dashboard': college_dashboard,
+        'university_dashboard': university_dashboard,
+        'conversation': conversation,
+    }
+
+
+def run_route(build, runs, query_counter):
+    latencies, queries = [], []
+    for i in range(runs + 1):
+        client, url = build()
+        query_counter[0] = 0
+        start = time.perf_counter()
+        response = client.get(url)
+        elapsed = time.perf_counter() - start
+        if response.status_code != 200:
+            raise RuntimeError(f"{url} returned {response.status_code}")
+        if i:  # the first request warms the recommendation index and caches
+            latencies.append(elapsed * 1000)
+            queries.append(query_counter[0])
+    latencies = np.array(latencies)
+    return {
+        'p50_ms': round(float(np.percentile(latencies, 50)), 2),
+        'p95_ms': round(float(np.percentile(latencies, 95)), 2),
+        'mean_ms': round(float(latencies.mean()), 2),
+        'queries_mean': round(float(np.mean(queries)), 1),
+        'queries_max': int(max(queries)),
+        'throughput_rps': round(len(latencies) / (latencies.sum() / 1000), 1),
+    }
+
+
+def compare(results, previous_path):
+    with open(previous_path) as f:
+        previous = json.load(f)['routes']
+    print(f"\nChange against {previous_path}:")
+    for route, stats in results.items():
+        before = previous.get(route)
+        if not before:
+            continue
+        print(f"  {route:34} p50 {stats['p50_ms'] - before['p50_ms']:+9.1f} ms"
+              f"  p95 {stats['p95_ms'] - before['p95_ms']:+9.1f} ms"
+              f"  queries {stats['queries_mean'] - before['queries_mean']:+7.1f}")
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def main(args):
+    if 'bench' not in args.database_url and not args.reuse:
+        sys.exit("Refusing to regenerate a database whose URL does not mention 'bench'; pass --reuse or another URL.")
+
+    random.seed(SEED)
+    with app.app_context():
+        if not args.reuse:
+            generate_dataset(args)
+        sizes = dataset_sizes()
+        print("Dataset: " + ", ".join(f"{n} {table}" for table, n in sizes.items()))
+
+        query_counter = [0]
+
+        def count_query(*_):
+            query_counter[0] += 1
+        event.listen(db.engine, 'before_cursor_execute', count_query)
+        factories = request_factories()
+
+    results = {}
+    for route in ROUTES:
+        with app.app_context():
+            results[route] = run_route(factories[route], args.requests, query_counter)
+        stats = results[route]
+        print(f"  {route:34} p50 {stats['p50_ms']:8.1f} ms  p95 {stats['p95_ms']:8.1f} ms  "
+              f"{stats['queries_mean']:6.1f} queries  {stats['throughput_rps']:7.1f} req/s")
+
+    with open(args.output, 'w') as f:
+        json.dump({
+            'revision': git_revision(),
+            'recorded_at': datetime.utcnow().isoformat(timespec='seconds'),
+            'database': args.database_url.split('://')[0],
+            'dataset': sizes,
+            'requests_per_route': args.requests,
+            'routes': results,
+        }, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+if __name__ == '__main__':
+    main(ARGS)
@@ -0,0 +1,59 @@
+"""
+Import-time report for `import app`, i.e. the cold start of every gunicorn
+worker and of populate_db.py.
+
+  python bench_startup.py [--budget-ms 1000] [--top 10]
+
+Exits with status 1 when the import takes longer than the budget.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def import_times():
+    """Cumulative import time of app and of each module it imports directly, in ms,
+    plus the wall time of the whole subprocess."""
+    env = dict(os.environ, DATABASE_URL=os.getenv('DATABASE_URL', 'sqlite://'))
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import app'],
+                            cwd=HERE, env=env, capture_output=True, text=True, check=True)
+    wall_ms = (time.perf_counter() - start) * 1000
+
+    packages = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        # nesting is shown as two extra spaces per level; keep app and its direct imports
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if depth <= 1:
+            packages[name.strip()] = int(cumulative) / 1000
+    return packages, wall_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--budget-ms', type=float, default=float(os.getenv('STARTUP_BUDGET_MS', 1000)))
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    packages, wall_ms = import_times()
+    app_ms = packages.pop('app', 0.0)
+    print(f"import app: {app_ms:.0f} ms ({wall_ms:.0f} ms including interpreter start)")
+    print(f"budget:     {args.budget_ms:.0f} ms\n")
+    print("slowest imports:")
+    for name, ms in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {ms:8.1f} ms  {name}")
+
+    if app_ms > args.budget_ms:
+        print("\n❌ Over the startup budget!")
+        sys.exit(1)
+    print("\n✅ Within the startup budget.")
+
+if __name__ == '__main__':
+    main()
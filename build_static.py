@@ -0,0 +1,81 @@
+# Fingerprints the static assets for long-lived caching. Every file under
+# static/ (except user uploads) is copied to static/dist/ with a content hash
+# in its name, text assets also get .gz and .br siblings, and
+# static/dist/manifest.json maps the original names to the hashed ones.
+# app.py rewrites url_for('static', ...) through the manifest when it exists.
+# Run on every deploy; output is regenerated from scratch.
+import gzip
+import hashlib
+import json
+import os
+import shutil
+
+STATIC_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+DIST_FOLDER = os.path.join(STATIC_FOLDER, 'dist')
+SKIP_FOLDERS = {'uploads', 'dist'}
+COMPRESSIBLE_EXTENSIONS = {'.css', '.js', '.svg', '.json', '.txt', '.html'}
+HASH_LENGTH = 12
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def fingerprint(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(65536), b''):
+            digest.update(block)
+    return digest.hexdigest()[:HASH_LENGTH]
+
+
+def precompress(path):
+    with open(path, 'rb') as f:
+        data = f.read()
+    sizes = {}
+    with open(path + '.gz', 'wb') as f:
+        # mtime=0 keeps the output identical between builds
+        f.write(gzip.compress(data, compresslevel=9, mtime=0))
+    sizes['gzip'] = os.path.getsize(path + '.gz')
+    if brotli is not None:
+        with open(path + '.br', 'wb') as f:
+            f.write(brotli.compress(data, quality=11))
+        sizes['br'] = os.path.getsize(path + '.br')
+    return sizes
+
+
+def build_static():
+    shutil.rmtree(DIST_FOLDER, ignore_errors=True)
+    manifest = {}
+    original_bytes = compressed_bytes = 0
+
+    for root, dirs, files in os.walk(STATIC_FOLDER):
+        if root == STATIC_FOLDER:
+            dirs[:] = [d for d in dirs if d not in SKIP_FOLDERS]
+        for name in sorted(files):
+            source = os.path.join(root, name)
+            logical = os.path.relpath(source, STATIC_FOLDER).replace(os.sep, '/')
+            stem, extension = os.path.splitext(logical)
+            hashed = f"{stem}.{fingerprint(source)}{extension}"
+
+            target = os.path.join(DIST_FOLDER, hashed)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copyfile(source, target)
+            manifest[logical] = hashed
+
+            if extension.lower() in COMPRESSIBLE_EXTENSIONS and os.path.getsize(source):
+                sizes = precompress(target)
+                original_bytes += os.path.getsize(source)
+                compressed_bytes += min(sizes.values())
+
+    with open(os.path.join(DIST_FOLDER, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+    if brotli is None:
+        print("Brotli is not installed, only .gz files were written.")
+    print(f"Fingerprinted {len(manifest)} assets; text assets {original_bytes} -> {compressed_bytes} bytes compressed.")
+    print("\nStatic assets are built! ✅")
+
+if __name__ == '__main__':
+    build_static()
@@ -0,0 +1,25 @@
+# Picked up automatically by gunicorn from the working directory.
+# Each worker writes its Prometheus metrics to files in PROMETHEUS_MULTIPROC_DIR
+# so /metrics can report totals for the whole server, not one worker.
+import os
+import shutil
+
+PROMETHEUS_MULTIPROC_DIR = os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR', '/tmp/elevatr_metrics')
+
+# Open conversations long-poll for new messages and hold a thread while they
+# wait. app.py lets at most half of a worker's threads (MESSAGE_MAX_WAITERS)
+# do that, so the other pages always have threads left.
+worker_class = 'gthread'
+workers = int(os.getenv('WEB_CONCURRENCY', 2))
+threads = int(os.environ.setdefault('GUNICORN_THREADS', '16'))
+
+
+def on_starting(server):
+    # values left over from a previous run would be merged into the new totals
+    shutil.rmtree(PROMETHEUS_MULTIPROC_DIR, ignore_errors=True)
+    os.makedirs(PROMETHEUS_MULTIPROC_DIR)
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,116 @@
+# Brings an existing database up to the models: adds nullable columns and
+# secondary indexes declared after the tables were first created, fills the
+# columns listed in BACKFILLED_COLUMNS and changes the type of those listed
+# in RETYPED_COLUMNS.
+# db.create_all() only creates missing tables, so older databases need this
+# once per schema change. Safe to run more than once.
+from datetime import datetime
+
+from sqlalchemy import Float, inspect, text
+from sqlalchemy.dialects import mysql
+from sqlalchemy.exc import IntegrityError, OperationalError
+from app import app, db
+
+
+def has_microseconds(column_type):
+    return not isinstance(column_type, mysql.DATETIME) or column_type.fsp == 6
+
+
+# (table, column, test that the reflected type is already the new one).
+# SQLite already stores doubles and microseconds, so only MySQL and PostgreSQL are altered.
+RETYPED_COLUMNS = [
+    # single-precision FLOAT broke the applicants keyset cursor
+    ('job_application', 'fit_score', lambda column_type: not isinstance(column_type, Float)),
+    # JobIndex.refresh and load_batch_recommendations need sub-second change detection
+    ('job_posting', 'updated_at', has_microseconds),
+    ('student', 'profile_updated_at', has_microseconds),
+    ('student_recommendation', 'computed_at', has_microseconds),
+]
+
+# (table, column, SQL value) for rows left NULL when the column was added;
+# :now is the current UTC time, like the models' defaults.
+BACKFILLED_COLUMNS = [
+    ('job_posting', 'updated_at', 'COALESCE(created_at, :now)'),
+    # JobIndex.refresh only re-reads rows stamped after the version it last saw
+    ('job_posting', 'index_version', '0'),
+]
+
+
+def add_missing_columns(inspector):
+    for table in db.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {col['name'] for col in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            if not column.nullable:
+                print(f"ERROR: {table.name}.{column.name} is NOT NULL and must be added by hand.")
+                continue
+            column_type = column.type.compile(dialect=db.engine.dialect)
+            with db.engine.begin() as conn:
+                conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+            print(f"Added column {table.name}.{column.name}.")
+
+
+def add_missing_indexes(inspector):
+    for table in db.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {ix['name'] for ix in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing:
+                continue
+            try:
+                index.create(db.engine)
+                print(f"Created {index.name} on {table.name}.")
+            except (IntegrityError, OperationalError) as e:
+                # e.g. duplicate (student_id, job_id) applications left over from before
+                print(f"ERROR: could not create {index.name}: {e.orig}")
+
+
+def backfill_columns(inspector):
+    for table_name, column_name, value in BACKFILLED_COLUMNS:
+        if not inspector.has_table(table_name):
+            continue
+        with db.engine.begin() as conn:
+            filled = conn.execute(text(f'UPDATE {table_name} SET {column_name} = {value} WHERE {column_name} IS NULL'),
+                                  {'now': datetime.utcnow()}).rowcount
+        if filled:
+            print(f"Filled {table_name}.{column_name} on {filled} rows.")
+
+
+def retype_columns(inspector):
+    dialect = db.engine.dialect
+    if dialect.name not in ('mysql', 'postgresql'):
+        return
+    for table_name, column_name, is_current in RETYPED_COLUMNS:
+        if not inspector.has_table(table_name):
+            continue
+        reflected = {col['name']: col['type'] for col in inspector.get_columns(table_name)}
+        if column_name not in reflected or is_current(reflected[column_name]):
+            continue
+        column = db.metadata.tables[table_name].columns[column_name]
+        column_type = column.type.compile(dialect=dialect)
+        if dialect.name == 'mysql':
+            statement = (f'ALTER TABLE {table_name} MODIFY COLUMN {column_name} {column_type} '
+                         f'{"NULL" if column.nullable else "NOT NULL"}')
+        else:
+            statement = f'ALTER TABLE {table_name} ALTER COLUMN {column_name} TYPE {column_type}'
+        with db.engine.begin() as conn:
+            conn.execute(text(statement))
+        print(f"Changed {table_name}.{column_name} to {column_type}.")
+
+
+def migrate_schema():
+    with app.app_context():
+        print("Creating missing tables...")
+        db.create_all()
+        add_missing_columns(inspect(db.engine))
+        retype_columns(inspect(db.engine))
+        backfill_columns(inspect(db.engine))
+        add_missing_indexes(inspect(db.engine))
+        print("\nSchema is up to date! ✅")
+
+if __name__ == '__main__':
+    migrate_schema()
@@ -0,0 +1,31 @@
+# One-off backfill of the normalised skill tables from the JSON skill columns.
+# Safe to run more than once; existing rows are rewritten from the JSON.
+from app import app, db, Student, JobPosting, parse_skills, set_student_skills, set_job_skills
+
+BATCH_SIZE = 500
+
+
+def migrate_skills():
+    with app.app_context():
+        print("Creating skill tables (existing tables are left alone)...")
+        db.create_all()
+
+        for model, setter, column in ((Student, set_student_skills, 'skills'),
+                                      (JobPosting, set_job_skills, 'required_skills')):
+            done = 0
+            last_id = 0
+            while True:
+                rows = model.query.filter(model.id > last_id).order_by(model.id).limit(BATCH_SIZE).all()
+                if not rows:
+                    break
+                for row in rows:
+                    setter(row, parse_skills(getattr(row, column)))
+                db.session.commit()
+                done += len(rows)
+                last_id = rows[-1].id
+            print(f"Migrated skills for {done} {model.__tablename__} rows.")
+
+        print("\nSkill tables are in sync with the JSON columns! ✅")
+
+if __name__ == '__main__':
+    migrate_skills()
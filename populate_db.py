@@ -1,9 +1,13 @@
+import argparse
 import pandas as pd
 # This import will work correctly when you run it from your local machine
-from app import app, db, Student, Company, JobPosting, StudentProject ,INDIAN_IT_CITIES
+from app import app, db, Student, Company, JobPosting, StudentProject ,INDIAN_IT_CITIES, Skill, job_skill, canonical_skill, refresh_job_fit_scores, claim_job_index_version
+from sqlalchemy import delete, func, insert, select, update
 from werkzeug.security import generate_password_hash
+from datetime import datetime
 import json
 import random
+import time
 
 # List of BPUT colleges to assign to students
 BPUT_COLLEGES = [
@@ -17,10 +21,222 @@ BPUT_COLLEGES = [
     "Orissa Engineering College, Bhubaneswar (OEC)",
 ]
 
-def create_dummy_data():
+CSV_PATH = 'internship_posted_data.csv'
+CHUNK_SIZE = 5000
+
+
+def company_email(company_name):
+    return f"{company_name.lower().replace(' ', '').replace('.', '')}@in.com"
+
+
+def split_skills(raw):
+    try:
+        return [s.strip() for s in raw.split(',')]
+    except AttributeError:
+        return []
+
+
+def job_description(role, skills):
+    return f"Seeking a talented {role} to join our team. Key skills include {skills}."
+
+
+def collect_skill_links(job_id, skills_list, known_skills, skill_rows, link_rows):
+    """Queues Skill rows the database has not seen yet and the job's job_skill links."""
+    job_skills = {canonical_skill(s): s[:100] for s in reversed(skills_list) if canonical_skill(s)}
+    for skill_id, name in job_skills.items():
+        if skill_id not in known_skills:
+            known_skills.add(skill_id)
+            skill_rows.append({'id': skill_id, 'name': name})
+        link_rows.append({'job_id': job_id, 'skill_id': skill_id})
+
+
+def insert_new_companies(chunk, company_ids, password_hash):
+    new_companies = chunk['company'].drop_duplicates()
+    new_companies = new_companies[~new_companies.isin(company_ids.keys())]
+    if len(new_companies):
+        db.session.execute(insert(Company), [
+            {'company_name': name, 'email': company_email(name), 'password_hash': password_hash}
+            for name in new_companies
+        ])
+        company_ids.update(db.session.execute(
+            select(Company.company_name, Company.id).where(Company.company_name.in_(new_companies.tolist()))
+        ).all())
+
+
+def load_postings(csv_path=CSV_PATH, chunk_size=CHUNK_SIZE):
+    """
+    Bulk-loads companies and job postings from the CSV.
+
+    The CSV is read in chunks so memory stays flat for large exports. Each
+    chunk is de-duplicated by company in pandas, then companies, new skills,
+    jobs and job-skill links go in as one batched INSERT each. Every seed
+    company gets the same precomputed password hash.
+    """
+    seed_password_hash = generate_password_hash('pass1234')
+    company_ids = dict(db.session.execute(select(Company.company_name, Company.id)).all())
+    known_skills = set(db.session.scalars(select(Skill.id)))
+    next_job_id = (db.session.scalar(select(func.max(JobPosting.id))) or 0) + 1
+
+    total_rows = 0
+    start = time.perf_counter()
+
+    for chunk in pd.read_csv(csv_path, chunksize=chunk_size):
+        # --- Companies ---
+        insert_new_companies(chunk, company_ids, seed_password_hash)
+
+        # --- Job Postings ---
+        job_rows, skill_rows, link_rows = [], [], []
+        for company, role, skills, cgpa in zip(chunk['company'], chunk['role'], chunk['skills'], chunk['cgpa_minimum']):
+            skills_list = split_skills(skills)
+            job_rows.append({
+                'id': next_job_id,
+                'company_id': company_ids[company],
+                'job_role': role,
+                'required_skills': json.dumps(skills_list),
+                'location': random.choice(INDIAN_IT_CITIES),
+                'cgpa_required': float(cgpa),
+                'description': job_description(role, skills),
+            })
+            collect_skill_links(next_job_id, skills_list, known_skills, skill_rows, link_rows)
+            next_job_id += 1
+
+        if skill_rows:
+            db.session.execute(insert(Skill), skill_rows)
+        db.session.execute(insert(JobPosting), job_rows)
+        if link_rows:
+            db.session.execute(insert(job_skill), link_rows)
+        db.session.commit()
+
+        total_rows += len(chunk)
+        elapsed = time.perf_counter() - start
+        print(f"  {total_rows} rows loaded ({total_rows / elapsed:.0f} rows/s)")
+
+    elapsed = time.perf_counter() - start
+    return total_rows, elapsed
+
+
+def upsert_postings(csv_path=CSV_PATH, chunk_size=CHUNK_SIZE):
+    """
+    Incrementally syncs companies and job postings with the CSV.
+
+    Rows are matched to existing postings on (company, role); when the CSV
+    repeats a key the last row wins, and when the table already holds several
+    postings for a key the oldest one is kept in sync. New postings are
+    inserted, postings whose skills, CGPA or description changed are updated
+    in one batch per chunk (stamped with a fresh index_version so running
+    workers re-index just those jobs), and everything else is left alone. Postings
+    missing from the CSV are not deleted, since that would take their
+    applications and messages with them.
     """
-    Wipes the database and populates it with jobs from the CSV 
-    and a set of 50 dummy students.
+    seed_password_hash = generate_password_hash('pass1234')
+    company_ids = dict(db.session.execute(select(Company.company_name, Company.id)).all())
+    known_skills = set(db.session.scalars(select(Skill.id)))
+
+    counts = {'inserted': 0, 'updated': 0, 'unchanged': 0, 'duplicates': 0}
+    total_rows = 0
+    start = time.perf_counter()
+
+    for chunk in pd.read_csv(csv_path, chunksize=chunk_size):
+        total_rows += len(chunk)
+        deduped = chunk.drop_duplicates(subset=['company', 'role'], keep='last')
+        counts['duplicates'] += len(chunk) - len(deduped)
+
+        insert_new_companies(deduped, company_ids, seed_password_hash)
+        chunk_company_ids = {company_ids[name] for name in deduped['company'].unique()}
+
+        existing = {}
+        for row in db.session.execute(
+            select(JobPosting.id, JobPosting.company_id, JobPosting.job_role, JobPosting.required_skills,
+                   JobPosting.cgpa_required, JobPosting.description)
+            .where(JobPosting.company_id.in_(chunk_company_ids))
+            .order_by(JobPosting.id)
+        ):
+            existing.setdefault((row.company_id, row.job_role), row)
+
+        now = datetime.utcnow()
+        new_rows, changed_rows, changed_skills, new_skills = [], [], {}, {}
+        for company, role, skills, cgpa in zip(deduped['company'], deduped['role'], deduped['skills'], deduped['cgpa_minimum']):
+            skills_list = split_skills(skills)
+            values = {
+                'required_skills': json.dumps(skills_list),
+                'cgpa_required': float(cgpa),
+                'description': job_description(role, skills),
+            }
+            key = (company_ids[company], role)
+            current = existing.get(key)
+            if current is None:
+                new_rows.append({'company_id': key[0], 'job_role': role,
+                                 'location': random.choice(INDIAN_IT_CITIES), 'created_at': now, 'updated_at': now, **values})
+                new_skills[key] = skills_list
+            elif (current.required_skills, current.cgpa_required, current.description) != tuple(values.values()):
+                changed_rows.append({'id': current.id, 'updated_at': now, **values})
+                changed_skills[current.id] = skills_list
+            else:
+                counts['unchanged'] += 1
+
+        if new_rows or changed_rows:
+            # holds the version counter's row lock until this chunk commits
+            version = claim_job_index_version(db.session)
+            for row in new_rows + changed_rows:
+                row['index_version'] = version
+        if new_rows:
+            max_id_before = db.session.scalar(select(func.max(JobPosting.id))) or 0
+            db.session.execute(insert(JobPosting), new_rows)
+            for row in db.session.execute(
+                select(JobPosting.id, JobPosting.company_id, JobPosting.job_role)
+                .where(JobPosting.id > max_id_before, JobPosting.company_id.in_(chunk_company_ids))
+                .order_by(JobPosting.id)
+            ):
+                key = (row.company_id, row.job_role)
+                if key in new_skills:
+                    changed_skills[row.id] = new_skills.pop(key)
+        if changed_rows:
+            db.session.execute(update(JobPosting), changed_rows)
+            db.session.execute(delete(job_skill).where(job_skill.c.job_id.in_([r['id'] for r in changed_rows])))
+
+        skill_rows, link_rows = [], []
+        for job_id, skills_list in changed_skills.items():
+            collect_skill_links(job_id, skills_list, known_skills, skill_rows, link_rows)
+        if skill_rows:
+            db.session.execute(insert(Skill), skill_rows)
+        if link_rows:
+            db.session.execute(insert(job_skill), link_rows)
+        db.session.commit()
+        # applicants of an edited posting keep stored fit scores
+        for row in changed_rows:
+            refresh_job_fit_scores(row['id'])
+
+        counts['inserted'] += len(new_rows)
+        counts['updated'] += len(changed_rows)
+        elapsed = time.perf_counter() - start
+        print(f"  {total_rows} rows synced ({total_rows / elapsed:.0f} rows/s): "
+              f"{counts['inserted']} inserted, {counts['updated']} updated, {counts['unchanged']} unchanged")
+
+    elapsed = time.perf_counter() - start
+    return counts, elapsed
+
+
+def sync_postings(csv_path=CSV_PATH, chunk_size=CHUNK_SIZE):
+    """
+    Upserts jobs from the CSV without touching students, applications or messages.
+    """
+    with app.app_context():
+        db.create_all()
+        try:
+            counts, elapsed = upsert_postings(csv_path, chunk_size)
+        except FileNotFoundError:
+            print(f"ERROR: '{csv_path}' not found. Please make sure it's in the same directory.")
+            return
+
+        print(f"Finished syncing job postings in {elapsed:.2f}s: {counts['inserted']} inserted, "
+              f"{counts['updated']} updated, {counts['unchanged']} unchanged, "
+              f"{counts['duplicates']} repeated (company, role) rows skipped.")
+        print("\nJob postings are up to date! ✅")
+
+
+def create_dummy_data(csv_path=CSV_PATH, chunk_size=CHUNK_SIZE):
+    """
+    Wipes the database and populates it with jobs from the CSV.
     """
     with app.app_context():
         print("Dropping all tables from the database...")
@@ -28,57 +244,24 @@ def create_dummy_data():
         print("Creating new tables...")
         db.create_all()
 
-        
         try:
-            df = pd.read_csv('internship_posted_data.csv')
-            print(f"Successfully loaded {len(df)} jobs from CSV.")
+            total_rows, elapsed = load_postings(csv_path, chunk_size)
         except FileNotFoundError:
-            print("ERROR: 'job_postings22 - Copy.csv' not found. Please make sure it's in the same directory.")
+            print(f"ERROR: '{csv_path}' not found. Please make sure it's in the same directory.")
             return
 
-        # --- Create Companies and Job Postings ---
-        all_skills = set()
-        companies_cache = {} # To avoid querying the DB repeatedly
-
-        for index, row in df.iterrows():
-            company_name = row['company']
-            
-            if company_name not in companies_cache:
-                company = Company(
-                    company_name=company_name,
-                    email=f"{company_name.lower().replace(' ', '').replace('.', '')}@in.com",
-                    password_hash=generate_password_hash('pass1234')
-                )
-                db.session.add(company)
-                db.session.commit() # Commit to get the ID
-                companies_cache[company_name] = company.id
-            
-            company_id = companies_cache[company_name]
-            
-            # Create Job Posting
-            try:
-                skills_list = [s.strip() for s in row['skills'].split(',')]
-                all_skills.update(skills_list)
-            except AttributeError:
-                skills_list = [] 
-
-            job = JobPosting(
-                company_id=company_id,
-                job_role=row['role'],
-                required_skills=json.dumps(skills_list),
-                location=random.choice(INDIAN_IT_CITIES),
-                cgpa_required=float(row['cgpa_minimum']),
-                description=f"Seeking a talented {row['role']} to join our team. Key skills include {row['skills']}."
-            )
-            db.session.add(job)
-
-        print("Finished processing companies and job postings.")
-
-        
-
-        # Commit all students and jobs
-        db.session.commit()
+        print(f"Finished processing companies and job postings: {total_rows} rows in {elapsed:.2f}s "
+              f"({total_rows / max(elapsed, 1e-9):.0f} rows/s).")
         print("\nDatabase has been successfully populated with dummy data! ✅")
 
 if __name__ == '__main__':
-    create_dummy_data()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Reset the database and load job postings from a CSV.")
+    parser.add_argument('--csv', default=CSV_PATH)
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+    parser.add_argument('--incremental', action='store_true',
+                        help="upsert jobs on (company, role) instead of dropping every table")
+    args = parser.parse_args()
+    if args.incremental:
+        sync_postings(args.csv, args.chunk_size)
+    else:
+        create_dummy_data(args.csv, args.chunk_size)
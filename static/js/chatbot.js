@@ -2,23 +2,66 @@ const chatBox = document.getElementById("chat-box");
 const msgInput = document.getElementById("msg");
 const sendBtn = document.getElementById("send");
 
-sendBtn.onclick = async () => {
-  const msg = msgInput.value.trim();
-  if (!msg) return;
-
-  // show user message
-  chatBox.innerHTML += `<div class='text-right text-blue-700 my-1'>${msg}</div>`;
-  msgInput.value = "";
+function addBubble(side, classes) {
+  const wrapper = document.createElement("div");
+  wrapper.className = side === "user" ? "text-right" : "text-left";
+  const bubble = document.createElement("div");
+  bubble.className = `inline-block px-3 py-2 rounded-xl chat-bubble whitespace-pre-wrap ${classes}`;
+  wrapper.appendChild(bubble);
+  chatBox.appendChild(wrapper);
+  chatBox.scrollTop = chatBox.scrollHeight;
+  return bubble;
+}
 
-  // send to backend
-  const res = await fetch("/chatbot_api", {
+// reads the server-sent events from /chatbot_stream and appends each delta as it arrives
+async function streamReply(msg, bubble) {
+  const res = await fetch("/chatbot_stream", {
     method: "POST",
     headers: { "Content-Type": "application/json" },
     body: JSON.stringify({ message: msg })
   });
-  const data = await res.json();
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
 
-  // show bot reply
-  chatBox.innerHTML += `<div class='text-left text-gray-700 my-1'>${data.reply}</div>`;
-  chatBox.scrollTop = chatBox.scrollHeight;
-};
+  while (true) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    const events = buffer.split("\n\n");
+    buffer = events.pop();
+    for (const event of events) {
+      if (!event.startsWith("data: ")) continue;
+      const data = JSON.parse(event.slice(6));
+      if (data.delta) bubble.textContent += data.delta;
+      if (data.error) bubble.textContent = data.error;
+      chatBox.scrollTop = chatBox.scrollHeight;
+    }
+  }
+}
+
+async function sendMessage() {
+  const msg = msgInput.value.trim();
+  if (!msg) return;
+
+  const placeholder = chatBox.querySelector('.text-center');
+  if (placeholder) placeholder.remove();
+
+  addBubble("user", "bg-blue-600 text-white").textContent = msg;
+  msgInput.value = "";
+
+  const botBubble = addBubble("bot", "bg-gray-200 text-gray-800");
+  botBubble.textContent = "";
+  try {
+    await streamReply(msg, botBubble);
+  } catch (error) {
+    botBubble.parentElement.className = "text-left text-red-600";
+    botBubble.textContent = "⚠️ Error connecting to chatbot.";
+  }
+}
+
+sendBtn.addEventListener("click", sendMessage);
+msgInput.addEventListener("keypress", (e) => {
+  if (e.key === "Enter") sendMessage();
+});
@@ -0,0 +1,68 @@
+const messageList = document.getElementById("chat-messages");
+const messageForm = document.getElementById("message-form");
+const messagesUrl = messageList.dataset.messagesUrl;
+const userId = Number(messageList.dataset.userId);
+const userRole = messageList.dataset.userRole;
+let lastId = Number(messageList.dataset.lastId);
+
+function appendMessage(message) {
+  if (messageList.querySelector(`[data-message-id="${message.id}"]`)) return;
+
+  const mine = message.sender_id === userId && message.sender_role === userRole;
+  const bubble = document.createElement("div");
+  bubble.dataset.messageId = message.id;
+  bubble.className = `message p-3 rounded-lg ${mine ? "sent" : "received"}`;
+
+  const content = document.createElement("p");
+  content.textContent = message.content;
+  const time = document.createElement("span");
+  time.className = "text-xs text-gray-400 block text-right mt-1";
+  time.textContent = message.display_time;
+
+  bubble.append(content, time);
+  messageList.appendChild(bubble);
+  messageList.scrollTop = messageList.scrollHeight;
+  lastId = Math.max(lastId, message.id);
+}
+
+// long-polls /conversation/<id>/messages; the server answers as soon as something new arrives,
+// or at once with retry_after when too many conversations are already waiting on it
+async function pollMessages() {
+  while (true) {
+    try {
+      const res = await fetch(`${messagesUrl}?after=${lastId}&wait=20`, {
+        headers: { Accept: "application/json" }
+      });
+      if (res.status === 403) return;
+      if (!res.ok) throw new Error(res.statusText);
+      const data = await res.json();
+      data.messages.forEach(appendMessage);
+      if (data.retry_after) {
+        await new Promise(resolve => setTimeout(resolve, data.retry_after * 1000));
+      }
+    } catch (error) {
+      await new Promise(resolve => setTimeout(resolve, 5000));
+    }
+  }
+}
+
+messageForm.addEventListener("submit", async (e) => {
+  e.preventDefault();
+  const textarea = messageForm.elements.content;
+  if (!textarea.value.trim()) return;
+
+  const res = await fetch(messageForm.action, {
+    method: "POST",
+    headers: { Accept: "application/json" },
+    body: new FormData(messageForm)
+  });
+  if (res.ok) {
+    appendMessage(await res.json());
+    textarea.value = "";
+  } else {
+    messageForm.submit();
+  }
+});
+
+messageList.scrollTop = messageList.scrollHeight;
+pollMessages();
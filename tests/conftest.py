@@ -0,0 +1,35 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+# app.py reads DATABASE_URL at import time, so point it at a scratch SQLite file first
+DATABASE_PATH = os.path.join(tempfile.mkdtemp(prefix='elevatr_tests_'), 'test.db')
+os.environ['DATABASE_URL'] = f'sqlite:///{DATABASE_PATH}'
+os.environ.setdefault('CHATBOT_BACKEND', 'fake')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as elevatr  # noqa: E402
+
+
+@pytest.fixture
+def app_module(monkeypatch):
+    """The app module with empty tables and a fresh, unbuilt job index."""
+    monkeypatch.setattr(elevatr, 'JOB_INDEX', elevatr.JobIndex())
+    elevatr.RECOMMENDATION_CACHE.clear()
+    elevatr.app.config['TESTING'] = True
+    with elevatr.app.app_context():
+        elevatr.db.drop_all()
+        elevatr.db.create_all()
+        yield elevatr
+        elevatr.db.session.remove()
+
+
+def login(client, role, user_id, **extra):
+    with client.session_transaction() as s:
+        s['logged_in'] = True
+        s['role'] = role
+        s['user_id'] = user_id
+        s.update(extra)
+    return client
@@ -0,0 +1,40 @@
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from conftest import login
+from test_video_room import accepted_application
+
+
+def test_apply_twice_reports_already_applied(app_module):
+    _, application_id = accepted_application(app_module)
+    application = app_module.db.session.get(app_module.JobApplication, application_id)
+    client = login(app_module.app.test_client(), 'student', application.student_id)
+
+    response = client.get(f'/apply_job/{application.job_id}', follow_redirects=True)
+    assert b'You have already applied for this job.' in response.data
+    assert app_module.JobApplication.query.count() == 1
+
+
+def test_apply_to_missing_job_is_not_found(app_module):
+    _, application_id = accepted_application(app_module)
+    student_id = app_module.db.session.get(app_module.JobApplication, application_id).student_id
+    client = login(app_module.app.test_client(), 'student', student_id)
+
+    assert client.get('/apply_job/9999').status_code == 404
+
+
+def test_other_integrity_errors_are_not_reported_as_duplicates(app_module, monkeypatch):
+    _, application_id = accepted_application(app_module)
+    application = app_module.db.session.get(app_module.JobApplication, application_id)
+    other = app_module.Student(full_name="Other Student", email="other@test.in", college=app_module.BPUT_COLLEGES[0],
+                               registration_number="T000000002", password_hash='x', cgpa=8.0)
+    app_module.db.session.add(other)
+    app_module.db.session.commit()
+    client = login(app_module.app.test_client(), 'student', other.id)
+
+    def failing_commit():
+        raise IntegrityError('INSERT INTO job_application', {}, Exception('FOREIGN KEY constraint failed'))
+    monkeypatch.setattr(app_module.db.session, 'commit', failing_commit)
+    # TESTING propagates the re-raised error instead of rendering a 500
+    with pytest.raises(IntegrityError):
+        client.get(f'/apply_job/{application.job_id}')
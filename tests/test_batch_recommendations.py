@@ -0,0 +1,67 @@
+import json
+from datetime import datetime
+
+from batch_recommendations import batch_recommendations
+
+
+def add_student(app_module, projects=0):
+    student = app_module.Student(full_name="Test Student", email="student@test.in", college=app_module.BPUT_COLLEGES[0],
+                                 registration_number="T000000001", password_hash='x', cgpa=8.0,
+                                 skills=json.dumps(['python']))
+    app_module.db.session.add(student)
+    app_module.db.session.flush()
+    for _ in range(projects):
+        app_module.db.session.add(app_module.StudentProject(student_id=student.id, project_title='p', description='an app'))
+    app_module.db.session.commit()
+    return student.id
+
+
+def test_empty_job_table_clears_stored_recommendations(app_module):
+    student_id = add_student(app_module)
+    app_module.db.session.add(app_module.StudentRecommendation(student_id=student_id, rank=1, job_id=42, score=50.0,
+                                                               roadmap='[]', computed_at=datetime.utcnow()))
+    app_module.db.session.commit()
+
+    batch_recommendations(workers=1, chunk_size=100, top_k=5)
+
+    assert app_module.StudentRecommendation.query.count() == 0
+    assert app_module.get_recommendations(student_id) == []
+
+
+def test_postings_without_terms_are_scored_like_live(app_module):
+    student_id = add_student(app_module, projects=2)
+    company = app_module.Company(company_name="Test Company", email="company@test.in", password_hash='x')
+    app_module.db.session.add(company)
+    app_module.db.session.commit()
+    # only stop words, so the TF-IDF vocabulary is empty
+    app_module.db.session.add(app_module.JobPosting(company_id=company.id, job_role='The', description='and',
+                                                    required_skills='[]', cgpa_required=7.0, location='Pune'))
+    app_module.db.session.commit()
+
+    live = app_module.compute_recommendations(student_id)
+    batch_recommendations(workers=1, chunk_size=100, top_k=5)
+    stored = [(row.job_id, row.score) for row in app_module.StudentRecommendation.query.order_by('rank')]
+
+    assert live and stored == [(rec['job_id'], rec['score']) for rec in live]
+
+
+def test_student_without_eligible_jobs_is_served_from_the_batch(app_module, monkeypatch):
+    student_id = add_student(app_module)
+    company = app_module.Company(company_name="Test Company", email="company@test.in", password_hash='x')
+    app_module.db.session.add(company)
+    app_module.db.session.commit()
+    job = app_module.JobPosting(company_id=company.id, job_role='Python Developer', description='python apps',
+                                required_skills='["python"]', cgpa_required=7.0, location='Pune')
+    app_module.db.session.add(job)
+    app_module.db.session.commit()
+    # the only job is already applied to, so the top-k comes out empty
+    app_module.db.session.add(app_module.JobApplication(student_id=student_id, job_id=job.id))
+    app_module.db.session.commit()
+
+    batch_recommendations(workers=1, chunk_size=100, top_k=5)
+
+    def live_scoring(student_id):
+        raise AssertionError("scored live")
+    monkeypatch.setattr(app_module, 'compute_recommendations', live_scoring)
+    assert app_module.StudentRecommendation.query.count() == 0
+    assert app_module.get_recommendations(student_id) == []
@@ -0,0 +1,18 @@
+from prometheus_client import REGISTRY
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_cache_lookups_and_upstream_latency_are_exported(app_module):
+    cache = app_module.ChatReplyCache(maxsize=8, ttl=60)
+    before = {result: sample('chatbot_cache_lookups_total', result=result) for result in ('hit', 'miss')}
+    upstream_before = sample('chatbot_upstream_seconds_count', outcome='ok')
+
+    assert ''.join(cache.stream('What is Flask?', lambda: iter(['A web ', 'framework.']))) == 'A web framework.'
+    assert ''.join(cache.stream('what is  flask?', lambda: iter(['unused']))) == 'A web framework.'
+
+    assert sample('chatbot_cache_lookups_total', result='miss') == before['miss'] + 1
+    assert sample('chatbot_cache_lookups_total', result='hit') == before['hit'] + 1
+    assert sample('chatbot_upstream_seconds_count', outcome='ok') == upstream_before + 1
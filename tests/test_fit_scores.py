@@ -0,0 +1,54 @@
+import json
+import re
+
+from conftest import login
+
+
+def make_applications(app_module, applicants=30):
+    company = app_module.Company(company_name="Test Company", email="company@test.in", password_hash='x')
+    app_module.db.session.add(company)
+    app_module.db.session.commit()
+    jobs = []
+    for role in ['Python Developer', 'Java Developer', 'Data Analyst']:
+        job = app_module.JobPosting(company_id=company.id, job_role=role, description=f"{role} using SQL",
+                                    required_skills=json.dumps(role.lower().split()[:1]), cgpa_required=7.0,
+                                    location='Pune')
+        app_module.db.session.add(job)
+        jobs.append(job)
+    skills = [['python'], ['java', 'sql'], ['python', 'sql'], ['excel']]
+    for n in range(applicants):
+        student = app_module.Student(full_name=f"Student {n}", email=f"s{n}@test.in", college=app_module.BPUT_COLLEGES[0],
+                                     registration_number=f"T{n:09d}", password_hash='x', cgpa=6.5 + n % 3,
+                                     skills=json.dumps(skills[n % len(skills)]))
+        app_module.db.session.add(student)
+        app_module.db.session.flush()
+        if n % 2:
+            app_module.db.session.add(app_module.StudentProject(student_id=student.id, project_title='p',
+                                                                description='REST API in python'))
+        for job in jobs:
+            app_module.db.session.add(app_module.JobApplication(student_id=student.id, job_id=job.id))
+    app_module.db.session.commit()
+    return company.id, jobs
+
+
+def test_student_refresh_matches_per_job_scores(app_module):
+    _, jobs = make_applications(app_module, applicants=4)
+    for student in app_module.Student.query.all():
+        app_module.refresh_student_fit_scores(student.id)
+        for application in app_module.JobApplication.query.filter_by(student_id=student.id):
+            expected = app_module.get_fit_scores_for_job(application.job_posting, [student])[student.id]
+            assert application.fit_score == expected
+
+
+def test_applicants_pages_cover_every_application_once(app_module, monkeypatch):
+    company_id, jobs = make_applications(app_module)
+    monkeypatch.setattr(app_module, 'APPLICANTS_PAGE_SIZE', 4)
+    client = login(app_module.app.test_client(), 'company', company_id)
+
+    seen, url = [], f'/applicants/{jobs[0].id}'
+    while url:
+        html = client.get(url).get_data(as_text=True)
+        seen.extend(re.findall(r'>(Student \d+)</h5>', html))
+        next_link = re.search(r'href="(/applicants/[^"]*after_score[^"]*)"', html)
+        url = next_link and next_link.group(1).replace('&amp;', '&')
+    assert len(seen) == len(set(seen)) == 30
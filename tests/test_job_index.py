@@ -0,0 +1,123 @@
+import json
+
+from conftest import login
+
+
+def add_student(app_module, skills):
+    student = app_module.Student(full_name="Test Student", email="student@test.in", college=app_module.BPUT_COLLEGES[0],
+                                 registration_number="T000000001", password_hash='x', cgpa=8.0,
+                                 skills=json.dumps(skills))
+    app_module.db.session.add(student)
+    app_module.db.session.commit()
+    return student.id
+
+
+def add_company(app_module):
+    company = app_module.Company(company_name="Test Company", email="company@test.in", password_hash='x')
+    app_module.db.session.add(company)
+    app_module.db.session.commit()
+    return company.id
+
+
+def test_first_job_posted_into_empty_database(app_module):
+    student_id = add_student(app_module, ['python', 'flask'])
+    company_id = add_company(app_module)
+    client = app_module.app.test_client()
+
+    # builds the index while the job table is still empty
+    assert login(client, 'student', student_id).get('/student_profile').status_code == 200
+    assert app_module.JOB_INDEX.built
+    assert app_module.JOB_INDEX.vectorizer is None
+
+    company = login(app_module.app.test_client(), 'company', company_id)
+    response = company.post('/post_job', data={
+        'job_role': 'Python Developer', 'description': 'Build Flask APIs in Python.',
+        'required_skills': 'python, flask', 'cgpa_required': '7.0', 'location': 'Pune',
+    })
+    assert response.status_code == 302
+    assert list(app_module.JOB_INDEX.job_ids) == [app_module.JobPosting.query.one().id]
+
+    assert client.get('/student_profile').status_code == 200
+    assert client.get('/all_internship_opportunity?location=Pune').status_code == 200
+    recommended = app_module.get_recommendations(student_id)
+    assert [rec['job'].job_role for rec in recommended] == ['Python Developer']
+
+
+def add_job(app_module, company_id, role, location='Pune'):
+    job = app_module.JobPosting(company_id=company_id, job_role=role, description=role, cgpa_required=7.0,
+                                location=location, required_skills=json.dumps(role.lower().split()[:1]))
+    app_module.db.session.add(job)
+    app_module.db.session.commit()
+    return job.id
+
+
+def test_snapshot_is_not_changed_by_later_updates(app_module):
+    company_id = add_company(app_module)
+    add_job(app_module, company_id, 'Python Developer')
+    add_job(app_module, company_id, 'Java Developer')
+    app_module.JOB_INDEX.refresh()
+    before = app_module.JOB_INDEX.snapshot()
+    scores_before = before.similarities('python developer')
+
+    add_job(app_module, company_id, 'Python Intern', location='Delhi')
+    app_module.JOB_INDEX.refresh()
+
+    assert len(before.job_ids) == len(before.cgpa_required) == len(before.skills) == 2
+    assert (before.similarities('python developer') == scores_before).all()
+    assert len(app_module.JOB_INDEX.snapshot().similarities('python developer')) == 3
+
+
+def test_refresh_picks_up_edits_stamped_before_the_last_refresh(app_module):
+    company_id = add_company(app_module)
+    first, second, third = (add_job(app_module, company_id, role) for role in
+                            ['Python Developer', 'Java Developer', 'Go Developer'])
+    stale = app_module.datetime.utcnow()
+    app_module.JOB_INDEX.refresh()
+    seen = app_module.JOB_INDEX.version
+
+    # a bulk write whose updated_at was taken before the refresh but committed after it
+    JobPosting = app_module.JobPosting
+    version = app_module.claim_job_index_version(app_module.db.session)
+    app_module.db.session.execute(app_module.update(JobPosting).where(JobPosting.id == second)
+                                  .values(location='Delhi', updated_at=stale, index_version=version))
+    app_module.db.session.commit()
+    app_module.db.session.get(JobPosting, third).location = 'Mumbai'
+    app_module.db.session.commit()
+    app_module.JOB_INDEX.refresh()
+
+    index = app_module.JOB_INDEX.snapshot()
+    assert index.locations[list(index.job_ids).index(second)] == 'Delhi'
+    assert index.locations[list(index.job_ids).index(third)] == 'Mumbai'
+    assert app_module.JOB_INDEX.version == seen + 2
+
+
+def test_refresh_after_delete_and_insert_indexes_the_new_job(app_module):
+    company_id = add_company(app_module)
+    ids = [add_job(app_module, company_id, role) for role in
+           ['Python Developer', 'Java Developer', 'Go Developer', 'Data Analyst', 'Web Designer']]
+    app_module.JOB_INDEX.refresh()
+
+    app_module.db.session.delete(app_module.db.session.get(app_module.JobPosting, ids[1]))
+    app_module.db.session.commit()
+    new_id = add_job(app_module, company_id, 'Python Intern')
+    app_module.JOB_INDEX.refresh()
+
+    assert list(app_module.JOB_INDEX.job_ids) == [ids[0], *ids[2:], new_id]
+
+
+def test_rows_appended_twice_are_indexed_once(app_module):
+    company_id = add_company(app_module)
+    # enough rows that two appended ones stay under JobIndex.REBUILD_RATIO
+    for n in range(20):
+        add_job(app_module, company_id, f'Python Developer {n}')
+    app_module.JOB_INDEX.refresh()
+    new_id = add_job(app_module, company_id, 'Python Intern')
+
+    # what two threads that both passed the job_ids[-1] check would append
+    rows = app_module.JOB_INDEX._load_rows(after_id=new_id - 1)
+    app_module.JOB_INDEX.add_rows(rows)
+    app_module.JOB_INDEX.add_rows(rows)
+
+    index = app_module.JOB_INDEX.snapshot()
+    assert list(index.job_ids).count(new_id) == 1
+    assert index.postings.shape[0] == len(index.job_ids) == len(index.skills)
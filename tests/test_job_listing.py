@@ -0,0 +1,42 @@
+import json
+
+from conftest import login
+
+
+def test_city_listing_pages_follow_match_score(app_module):
+    company = app_module.Company(company_name="Test Company", email="company@test.in", password_hash='x')
+    student = app_module.Student(full_name="Test Student", email="student@test.in", college=app_module.BPUT_COLLEGES[0],
+                                 registration_number="T000000001", password_hash='x', cgpa=7.5,
+                                 skills=json.dumps(['python', 'flask']))
+    app_module.db.session.add_all([company, student])
+    app_module.db.session.commit()
+
+    roles = ['Python Developer', 'Flask Engineer', 'Java Developer', 'Python Flask Developer', 'Designer']
+    for n in range(30):
+        role = roles[n % len(roles)]
+        job = app_module.JobPosting(company_id=company.id, job_role=role, description=role,
+                                    cgpa_required=7.0 if n % 2 else 8.0, location='Pune' if n % 3 else 'Delhi')
+        app_module.set_job_skills(job, role.lower().split()[:-1] or ['design'])
+        app_module.db.session.add(job)
+    app_module.db.session.commit()
+
+    client = login(app_module.app.test_client(), 'student', student.id)
+    full, _ = app_module.get_location_rankings(student, 'Pune', limit=100)
+    expected = sorted(full, key=lambda item: (-item['score'], -item['job'].id))
+    assert [item['job'].id for item in full] == [item['job'].id for item in expected]
+
+    seen, cursor = [], None
+    while True:
+        page, cursor = app_module.get_location_rankings(student, 'Pune', cursor=cursor and (
+            cursor['before_score'], cursor['before_id']), limit=7)
+        seen.extend(item['job'].id for item in page)
+        if cursor is None:
+            break
+        response = client.get('/all_internship_opportunity', query_string={'location': 'Pune', **cursor})
+        assert response.status_code == 200
+    assert seen == [item['job'].id for item in full]
+
+    # the skill filter applies without a city too
+    by_skill, _ = app_module.get_location_rankings(student, skill='java', limit=100)
+    assert by_skill and all(item['job'].job_role == 'Java Developer' for item in by_skill)
+    assert client.get('/all_internship_opportunity?skill=Java').status_code == 200
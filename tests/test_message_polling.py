@@ -0,0 +1,25 @@
+from conftest import login
+from test_video_room import accepted_application
+
+
+def test_notifier_caps_waiters_and_forgets_idle_conversations(app_module):
+    notifier = app_module.MessageNotifier(max_waiters=2)
+    with notifier.listen(1) as first, notifier.listen(1) as second, notifier.listen(2) as third:
+        assert (first, second, third) == (True, True, False)
+        version = notifier.version(1)
+        notifier.notify(1)
+        notifier.notify(2)
+        assert notifier.version(1) == version + 1
+        assert set(notifier.versions) == {1}
+    assert notifier.versions == {} and notifier.listeners == {} and notifier.waiters == 0
+
+
+def test_long_poll_answers_at_once_when_every_slot_is_taken(app_module, monkeypatch):
+    company_id, application_id = accepted_application(app_module)
+    monkeypatch.setattr(app_module, 'MESSAGE_NOTIFIER', app_module.MessageNotifier(max_waiters=0))
+    client = login(app_module.app.test_client(), 'company', company_id)
+
+    response = client.get(f'/conversation/{application_id}/messages?after=0&wait=20')
+    assert response.status_code == 200
+    assert response.get_json() == {'messages': [], 'last_id': 0,
+                                   'retry_after': app_module.MESSAGE_BUSY_RETRY_SECONDS}
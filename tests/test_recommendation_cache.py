@@ -0,0 +1,49 @@
+import json
+
+import pytest
+from sqlalchemy import text
+
+from conftest import login
+
+
+@pytest.fixture
+def committed_at_invalidation(app_module, monkeypatch):
+    """Records what another connection sees in the database whenever a student's cache entry is dropped."""
+    seen = []
+    invalidate = app_module.RECOMMENDATION_CACHE.invalidate
+
+    def recording_invalidate(student_id):
+        with app_module.db.engine.connect() as conn:
+            seen.append(conn.execute(text(
+                "SELECT s.skills, (SELECT COUNT(*) FROM student_project p WHERE p.student_id = s.id), "
+                "(SELECT COUNT(*) FROM job_application a WHERE a.student_id = s.id) FROM student s WHERE s.id = :id"
+            ), {'id': student_id}).one())
+        invalidate(student_id)
+    monkeypatch.setattr(app_module.RECOMMENDATION_CACHE, 'invalidate', recording_invalidate)
+    return seen
+
+
+def test_cache_is_dropped_only_after_the_change_is_committed(app_module, committed_at_invalidation):
+    student = app_module.Student(full_name="Test Student", email="student@test.in", college=app_module.BPUT_COLLEGES[0],
+                                 registration_number="T000000001", password_hash='x', cgpa=7.0,
+                                 skills=json.dumps(['java']))
+    company = app_module.Company(company_name="Test Company", email="company@test.in", password_hash='x')
+    app_module.db.session.add_all([student, company])
+    app_module.db.session.commit()
+    job = app_module.JobPosting(company_id=company.id, job_role='Developer', required_skills='[]',
+                                cgpa_required=6.0, location='Pune')
+    app_module.db.session.add(job)
+    app_module.db.session.commit()
+    client = login(app_module.app.test_client(), 'student', student.id)
+
+    client.post('/student_edit_profile', data={'full_name': "Test Student", 'email': "student@test.in",
+                                               'mobile': '', 'cgpa': '8.0', 'skills': 'python'})
+    client.post('/add_project', data={'project_title': 'API', 'description': 'Flask API'})
+    client.get(f'/delete_project/{app_module.StudentProject.query.one().id}')
+    client.get(f'/apply_job/{job.id}')
+
+    # (skills, projects, applications) as committed when each invalidation ran
+    assert [(json.loads(skills), projects, applications)
+            for skills, projects, applications in committed_at_invalidation] == [
+        (['python'], 0, 0), (['python'], 1, 0), (['python'], 0, 0), (['python'], 0, 1),
+    ]
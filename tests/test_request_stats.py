@@ -0,0 +1,22 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+
+def test_failed_statement_does_not_skew_later_timings(app_module):
+    with app_module.app.test_request_context('/'):
+        app_module.app.preprocess_request()
+        with app_module.db.engine.connect() as conn:
+            with pytest.raises(OperationalError):
+                conn.execute(text('SELECT * FROM no_such_table'))
+            conn.execute(text('SELECT 1'))
+            assert conn.info['query_started'] == {}
+        assert app_module.g.sql_count == 2
+
+
+def test_server_timing_is_left_off_streamed_responses(app_module):
+    client = app_module.app.test_client()
+    assert 'Server-Timing' in client.get('/').headers
+    response = client.post('/chatbot_stream', json={'message': 'hi'})
+    assert response.status_code == 200 and response.is_streamed
+    assert 'Server-Timing' not in response.headers
@@ -0,0 +1,20 @@
+import pytest
+
+Image = pytest.importorskip('PIL.Image')
+
+
+def test_same_stem_uploads_keep_separate_variants(app_module, monkeypatch, tmp_path):
+    monkeypatch.setitem(app_module.app.config, 'UPLOAD_FOLDER', str(tmp_path))
+    Image.new('RGB', (1200, 900), 'red').save(tmp_path / 'cert.png')
+    Image.new('RGB', (1200, 900), 'blue').save(tmp_path / 'cert.jpg')
+
+    assert app_module.make_upload_variants('cert.png')
+    assert app_module.make_upload_variants('cert.jpg')
+
+    for variant in app_module.UPLOAD_VARIANTS:
+        png_variant = tmp_path / app_module.variant_filename('cert.png', variant)
+        jpg_variant = tmp_path / app_module.variant_filename('cert.jpg', variant)
+        assert png_variant != jpg_variant
+        with Image.open(png_variant) as red, Image.open(jpg_variant) as blue:
+            assert red.convert('RGB').getpixel((0, 0))[0] > 200
+            assert blue.convert('RGB').getpixel((0, 0))[2] > 200
@@ -0,0 +1,118 @@
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from conftest import login
+
+
+def accepted_application(app_module):
+    company = app_module.Company(company_name="Test Company", email="company@test.in", password_hash='x')
+    student = app_module.Student(full_name="Test Student", email="student@test.in", college=app_module.BPUT_COLLEGES[0],
+                                 registration_number="T000000001", password_hash='x', cgpa=8.0)
+    app_module.db.session.add_all([company, student])
+    app_module.db.session.commit()
+    job = app_module.JobPosting(company_id=company.id, job_role='Developer', required_skills='[]',
+                                cgpa_required=7.0, location='Pune')
+    app_module.db.session.add(job)
+    app_module.db.session.commit()
+    application = app_module.JobApplication(student_id=student.id, job_id=job.id, status='Accepted')
+    app_module.db.session.add(application)
+    app_module.db.session.commit()
+    return company.id, application.id
+
+
+@pytest.fixture
+def whereby_stub(app_module, monkeypatch):
+    """A local Whereby API answering each POST with the next (status, delay) in `responses`."""
+    responses, calls = [], []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            calls.append(json.loads(self.rfile.read(int(self.headers['Content-Length']))))
+            status, delay = responses[min(len(calls), len(responses)) - 1]
+            time.sleep(delay)
+            body = json.dumps({'roomUrl': f'https://stub.whereby.com/room{len(calls)}'}).encode()
+            try:
+                self.send_response(status)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            except OSError:
+                pass  # the client gave up waiting
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(app_module, 'WHEREBY_API_URL', f'http://127.0.0.1:{server.server_port}/v1/meetings')
+    monkeypatch.setattr(app_module, 'WHEREBY_BACKOFF', 0)
+    yield responses, calls
+    server.shutdown()
+    server.server_close()
+
+
+def test_room_is_created_after_a_server_error(app_module, whereby_stub):
+    responses, calls = whereby_stub
+    responses += [(503, 0), (201, 0)]
+
+    assert app_module.create_whereby_room() == 'https://stub.whereby.com/room2'
+    assert len(calls) == 2
+
+
+def test_client_error_is_not_retried(app_module, whereby_stub):
+    responses, calls = whereby_stub
+    responses += [(400, 0)]
+
+    assert app_module.create_whereby_room() is None
+    assert len(calls) == 1
+
+
+def test_slow_response_times_out_and_is_retried(app_module, whereby_stub, monkeypatch):
+    responses, calls = whereby_stub
+    responses += [(201, 1.0), (201, 0)]
+    monkeypatch.setattr(app_module, 'WHEREBY_TIMEOUT', (1, 0.2))
+
+    start = time.perf_counter()
+    assert app_module.create_whereby_room() == 'https://stub.whereby.com/room2'
+    assert time.perf_counter() - start < 1.0
+    assert len(calls) == 2
+
+
+def test_room_is_marked_failed_when_provisioning_raises(app_module, monkeypatch):
+    _, application_id = accepted_application(app_module)
+    application = app_module.db.session.get(app_module.JobApplication, application_id)
+    application.video_room_status = 'pending'
+    application.video_room_requested_at = datetime.utcnow()
+    app_module.db.session.commit()
+
+    def broken_room():
+        raise RuntimeError("Whereby is down")
+    monkeypatch.setattr(app_module, 'create_whereby_room', broken_room)
+    app_module.provision_video_room(application_id)
+
+    app_module.db.session.expire_all()
+    assert app_module.db.session.get(app_module.JobApplication, application_id).video_room_status == 'failed'
+
+
+def test_stale_pending_room_can_be_requested_again(app_module, monkeypatch):
+    company_id, application_id = accepted_application(app_module)
+    submitted = []
+    monkeypatch.setattr(app_module.VIDEO_ROOM_EXECUTOR, 'submit', lambda fn, *args: submitted.append(args))
+    client = login(app_module.app.test_client(), 'company', company_id)
+
+    application = app_module.db.session.get(app_module.JobApplication, application_id)
+    application.video_room_status = 'pending'
+    application.video_room_requested_at = datetime.utcnow()
+    app_module.db.session.commit()
+    client.post(f'/update_application_status/{application_id}', data={'status': 'Accepted'})
+    assert submitted == []
+
+    application.video_room_requested_at = datetime.utcnow() - app_module.VIDEO_ROOM_PENDING_TIMEOUT - timedelta(seconds=1)
+    app_module.db.session.commit()
+    client.post(f'/update_application_status/{application_id}', data={'status': 'Accepted'})
+    assert submitted == [(application_id,)]